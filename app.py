@@ -5,14 +5,98 @@ Blog SEO Optimizer - Flask API Backend v3.0
 Advanced SEO optimization with Rank Math 90+ score guarantee
 """
 
-from flask import Flask, request, jsonify
+from flask import Flask, request
 from flask_cors import CORS
+from werkzeug.exceptions import RequestEntityTooLarge
+import os
 import re
+import sys
+import gzip
+import html
 import random
+import hashlib
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from itertools import islice
+from types import SimpleNamespace
+import orjson
+
+SERVICE_NAME = "Blog SEO Optimizer API"
+API_VERSION = "3.0.0"
+MAX_BATCH_ITEMS = 50
+# The keyword is repeated throughout the output and keys the per-keyword
+# caches (fragments, tags, compiled patterns), so its length is bounded
+MAX_KEYWORD_LENGTH = 200
+
+# Fields every optimize payload must carry, in the order errors report them
+_REQUIRED_FIELDS = ('title', 'html_code', 'focus_keyword', 'seo_score')
+_REQUIRED_FIELD_SET = frozenset(_REQUIRED_FIELDS)
+
+# JSON bodies smaller than this are sent as-is; below it gzip saves little
+_GZIP_MIN_SIZE = 500
+_GZIP_LEVEL = 6
 
 app = Flask(__name__)
+app.config['MAX_CONTENT_LENGTH'] = 2 * 1024 * 1024  # Bound request body memory
 CORS(app)  # Enable CORS for all routes
 
+# Precompiled regex patterns (compiled once at import, reused per request).
+# Tag bodies use [^<>] so a stray '<' can't make a failed match rescan the rest
+# of the document, keeping every pattern linear on malformed input.
+_TAG_STRIP_RE = re.compile(r'<[^<>]+>')
+# DOTALL so multi-line paragraphs match; callers bound the search at the last
+# </p> so an unclosed <p> can't make every later attempt scan to the end
+_P_RE = re.compile(r'<p(?![a-zA-Z0-9])[^<>]*>(.*?)</p>', re.IGNORECASE | re.DOTALL)
+# Only the start tags the score looks at, so other markup never reaches Python
+_SEO_TAG_RE = re.compile(r'<(title|meta|h[1-3]|a|img)(?![a-zA-Z0-9])([^<>]*)>', re.IGNORECASE)
+_H2_OPEN_RE = re.compile(r'<h2(?![a-zA-Z0-9])[^<>]*>', re.IGNORECASE)
+_H2_CLOSE_RE = re.compile(r'</h2>', re.IGNORECASE)
+_META_DESC_ATTR_RE = re.compile(r'name=["\']description["\']', re.IGNORECASE)
+_HREF_ATTR_RE = re.compile(r'href=["\'][^"\']*["\']')
+_HREF_EXTERNAL_ATTR_RE = re.compile(r'href=["\']https?://[^"\']*["\']')
+_ALT_ATTR_RE = re.compile(r'alt=["\'][^"\']*["\']')
+
+# Memoized /api/optimize results, keyed on a digest of the request inputs.
+# Entries hold the full optimized HTML, which for a 2 MB request is several
+# MB, so the LRU is bounded by memory as well as by entry count; a result
+# too large to leave room for others is returned without being cached.
+_RESPONSE_CACHE_SIZE = 256
+_RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+_RESPONSE_CACHE_MAX_ENTRY_BYTES = _RESPONSE_CACHE_MAX_BYTES // 16
+_response_cache = OrderedDict()
+_response_cache_bytes = 0
+_response_cache_lock = threading.Lock()
+
+# Spaces and Turkish letters mapped in one str.translate pass
+_IMAGE_SLUG_TABLE = str.maketrans({
+    ' ': '-', 'ı': 'i', 'ğ': 'g', 'ü': 'u', 'ş': 's', 'ö': 'o', 'ç': 'c'
+})
+
+_thread_local = threading.local()
+
+def _rng():
+    """Per-thread random generator, so worker threads never share RNG state"""
+    rng = getattr(_thread_local, 'rng', None)
+    if rng is None:
+        rng = _thread_local.rng = random.Random(os.urandom(8))
+    return rng
+
+@lru_cache(maxsize=4096)
+def keyword_slug(focus_keyword):
+    """URL slug for the focus keyword, cached for repeat-keyword traffic"""
+    return focus_keyword.lower().replace(' ', '-')
+
+@lru_cache(maxsize=4096)
+def keyword_pattern(focus_keyword):
+    """Case-insensitive pattern for the focus keyword, shared by every keyword match"""
+    return re.compile(re.escape(focus_keyword), re.IGNORECASE)
+
+@lru_cache(maxsize=4096)
+def image_slug(focus_keyword):
+    """ASCII file name slug for the focus keyword (Turkish letters folded)"""
+    return focus_keyword.lower().translate(_IMAGE_SLUG_TABLE)
+
 def optimize_title(title, focus_keyword):
     """Optimize title with focus keyword at the beginning, max 60 characters"""
     try:
@@ -30,15 +114,33 @@ def optimize_title(title, focus_keyword):
     except Exception as e:
         return f"{focus_keyword} - {title}"[:60]
 
+def extract_first_sentence(content, limit=300):
+    """Return the text before the first period, stripping tags only as far as needed"""
+    parts = []
+    length = 0
+    pos = 0
+    while length < limit:
+        match = _TAG_STRIP_RE.search(content, pos)
+        end = match.start() if match else len(content)
+        text = content[pos:end]
+        dot = text.find('.')
+        if dot >= 0:
+            parts.append(text[:dot])
+            break
+        parts.append(text)
+        length += len(text)
+        if not match:
+            break
+        pos = match.end()
+    
+    # Anything past the meta description length is truncated anyway
+    return ''.join(parts)[:limit]
+
 def generate_meta_description(content, focus_keyword):
     """Generate SEO-friendly meta description (150-160 characters)"""
     try:
-        # Clean content from HTML tags
-        clean_content = re.sub(r'<[^>]+>', '', content)
-        
-        # Extract first meaningful sentence
-        sentences = clean_content.split('.')
-        first_sentence = sentences[0] if sentences else ""
+        # Extract first meaningful sentence without stripping the whole document
+        first_sentence = extract_first_sentence(content)
         
         # Create meta description
         meta_desc = f"{first_sentence} {focus_keyword} konusunda kapsamlı rehber ve uzman danışmanlık hizmetleri."
@@ -53,34 +155,38 @@ def generate_meta_description(content, focus_keyword):
     except Exception as e:
         return f"{focus_keyword} konusunda kapsamlı rehber. 2025 güncel bilgiler ve uzman danışmanlık hizmetleri."
 
+@lru_cache(maxsize=4096)
+def keyword_tags(focus_keyword):
+    """All candidate tags for a keyword, most relevant first (cached per keyword)"""
+    return (
+        focus_keyword,
+        f"{focus_keyword} rehberi",
+        f"{focus_keyword} nasıl alınır",
+        f"{focus_keyword} 2025",
+        f"{focus_keyword} başvuru",
+        f"{focus_keyword} şartları",
+        f"{focus_keyword} belgeleri",
+        f"{focus_keyword} süreci",
+        f"{focus_keyword} faydaları",
+        f"{focus_keyword} avantajları"
+    )
+
 def generate_tags(focus_keyword):
     """Generate 5-10 relevant tags with high search volume, medium/low competition"""
     try:
-        base_tags = [
-            focus_keyword,
-            f"{focus_keyword} rehberi",
-            f"{focus_keyword} nasıl alınır",
-            f"{focus_keyword} 2025",
-            f"{focus_keyword} başvuru",
-            f"{focus_keyword} şartları",
-            f"{focus_keyword} belgeleri",
-            f"{focus_keyword} süreci",
-            f"{focus_keyword} faydaları",
-            f"{focus_keyword} avantajları"
-        ]
-        
         # Return 5-10 tags
-        return base_tags[:random.randint(5, 10)]
+        return list(keyword_tags(focus_keyword)[:_rng().randint(5, 10)])
     except Exception as e:
         return [focus_keyword, f"{focus_keyword} rehberi", f"{focus_keyword} 2025"]
 
+@lru_cache(maxsize=4096)
 def generate_image_fields(focus_keyword):
-    """Generate automatic image field values"""
+    """Generate automatic image field values (cached per keyword, treat as read-only)"""
     try:
         alt_text = f"{focus_keyword} konusunda detaylı bilgi ve rehber"
         
         # Generate SEO-friendly filename
-        filename = focus_keyword.lower().replace(' ', '-').replace('ı', 'i').replace('ğ', 'g').replace('ü', 'u').replace('ş', 's').replace('ö', 'o').replace('ç', 'c')
+        filename = image_slug(focus_keyword)
         image_title = f"{filename}-rehberi-2025"
         
         image_caption = f"{focus_keyword} Rehberi - 2025 Güncel Bilgiler"
@@ -96,39 +202,30 @@ def generate_image_fields(focus_keyword):
     except Exception as e:
         return {
             'alt_text': f"{focus_keyword} bilgi",
-            'image_title': f"{focus_keyword.lower().replace(' ', '-')}-2025",
+            'image_title': f"{keyword_slug(focus_keyword)}-2025",
             'image_caption': f"{focus_keyword} Rehberi",
             'image_description': f"{focus_keyword} hakkında bilgi"
         }
 
-def optimize_html_content(html_code, focus_keyword, optimized_title):
-    """Optimize HTML content according to SEO rules"""
-    try:
-        optimized = html_code
-        
-        # Add focus keyword to first paragraph if not present
-        if focus_keyword.lower() not in optimized.lower():
-            p_match = re.search(r'<p[^>]*>(.*?)</p>', optimized, re.IGNORECASE)
-            if p_match:
-                p_content = p_match.group(1)
-                new_p_content = f"{focus_keyword} konusunda {p_content}"
-                optimized = optimized.replace(p_match.group(0), f'<p>{new_p_content}</p>')
-        
-        # Add H2 heading with focus keyword if not present
-        if not re.search(rf'<h2[^>]*>.*{re.escape(focus_keyword)}.*</h2>', optimized, re.IGNORECASE):
-            h2_heading = f'<h2>{focus_keyword} Nedir?</h2>'
-            # Insert after first paragraph
-            p_match = re.search(r'</p>', optimized)
-            if p_match:
-                insert_pos = p_match.end()
-                optimized = optimized[:insert_pos] + '\n' + h2_heading + '\n' + optimized[insert_pos:]
-        
-        # Add H3 heading for better hierarchy
-        h3_heading = f'<h3>{focus_keyword} Avantajları</h3>'
-        optimized = optimized.replace('</h2>', '</h2>\n' + h3_heading + '\n', 1)
-        
-        # Add Table of Contents
-        toc = f'''<div class="table-of-contents">
+# Transition words added to the 2nd and 3rd paragraphs for readability
+_TRANSITION_WORDS = (
+    'Ayrıca', 'Bununla birlikte', 'Özellikle', 'Önemli olarak',
+    'Sonuç olarak', 'Bu nedenle', 'Bunun sonucunda', 'Kısacası'
+)
+
+@lru_cache(maxsize=1024)
+def keyword_fragments(focus_keyword):
+    """Build the keyword-dependent HTML inserted by optimize_html_content once per keyword"""
+    slug = keyword_slug(focus_keyword)
+    
+    # H2 heading with focus keyword, if not present
+    h2_heading = f'<h2>{focus_keyword} Nedir?</h2>'
+    
+    # H3 heading for better hierarchy
+    h3_heading = f'<h3>{focus_keyword} Avantajları</h3>'
+    
+    # Table of Contents
+    toc = f'''<div class="table-of-contents">
 <h3>İçindekiler</h3>
 <ul>
 <li><a href="#nedir">{focus_keyword} Nedir?</a></li>
@@ -137,43 +234,16 @@ def optimize_html_content(html_code, focus_keyword, optimized_title):
 <li><a href="#sartlar">{focus_keyword} Şartları</a></li>
 </ul>
 </div>'''
-        
-        # Insert TOC after first paragraph
-        p_match = re.search(r'</p>', optimized)
-        if p_match:
-            insert_pos = p_match.end()
-            optimized = optimized[:insert_pos] + '\n' + toc + '\n' + optimized[insert_pos:]
-        
-        # Add internal links (at least 2)
-        internal_links = [
-            f'<a href="/{focus_keyword.lower().replace(" ", "-")}" title="{focus_keyword}">daha fazla bilgi</a>',
-            f'<a href="/{focus_keyword.lower().replace(" ", "-")}-rehberi" title="{focus_keyword} rehberi">detaylı rehber</a>'
-        ]
-        
-        for i, link in enumerate(internal_links):
-            optimized = optimized.replace('</p>', f' {link}</p>', 1)
-        
-        # Add external link (at least 1, rel="nofollow")
-        external_link = f'<a href="https://www.google.com/search?q={focus_keyword}" target="_blank" rel="nofollow">Google\'da ara</a>'
-        optimized = optimized.replace('</p>', f' {external_link}</p>', 1)
-        
-        # Add transition words to improve readability
-        transition_words = [
-            'Ayrıca', 'Bununla birlikte', 'Özellikle', 'Önemli olarak',
-            'Sonuç olarak', 'Bu nedenle', 'Bunun sonucunda', 'Kısacası'
-        ]
-        
-        # Add transition words to some paragraphs
-        p_tags = re.findall(r'<p[^>]*>.*?</p>', optimized, re.IGNORECASE)
-        for i, p_tag in enumerate(p_tags[1:3]):  # Add to 2nd and 3rd paragraphs
-            if i < len(transition_words):
-                new_p = p_tag.replace('<p>', f'<p>{transition_words[i]}, ')
-                optimized = optimized.replace(p_tag, new_p, 1)
-        
-        # Ensure content is 600+ words
-        word_count = len(re.sub(r'<[^>]+>', '', optimized).split())
-        if word_count < 600:
-            additional_content = f'''
+    
+    # Internal links (at least 2) and external link (at least 1, rel="nofollow")
+    links = [
+        f'<a href="/{slug}" title="{focus_keyword}">daha fazla bilgi</a>',
+        f'<a href="/{slug}-rehberi" title="{focus_keyword} rehberi">detaylı rehber</a>',
+        f'<a href="https://www.google.com/search?q={focus_keyword}" target="_blank" rel="nofollow">Google\'da ara</a>'
+    ]
+    
+    # Extra sections appended when the content is under 600 words
+    additional_content = f'''
 <h3>{focus_keyword} Süreci</h3>
 <p>{focus_keyword} başvuru süreci oldukça basit ve hızlıdır. İlk olarak gerekli belgeleri hazırlamanız gerekmektedir. Bu belgeler arasında kimlik fotokopisi, adres belgesi ve diğer gerekli evraklar bulunmaktadır.</p>
 
@@ -183,66 +253,200 @@ def optimize_html_content(html_code, focus_keyword, optimized_title):
 <h3>Sonuç</h3>
 <p>{focus_keyword} konusunda bilgi sahibi olmak ve bu belgeyi almak için yukarıdaki adımları takip etmeniz yeterlidir. Bu rehber sayesinde süreç hakkında detaylı bilgi edinebilirsiniz.</p>
 '''
-            optimized += additional_content
+    # The padding starts on a new line, so its text and word count simply
+    # add to those of the content it is appended to
+    additional_text = _TAG_STRIP_RE.sub('', additional_content)
+    
+    return SimpleNamespace(
+        keyword_re=keyword_pattern(focus_keyword),
+        paragraph_prefix=f"{focus_keyword} konusunda ",
+        links=''.join(f' {link}' for link in links),
+        after_first_p=f'</p>\n{toc}\n',
+        after_first_p_with_h2=f'</p>\n{toc}\n\n{h2_heading}\n',
+        h2_close_with_h3=f'</h2>\n{h3_heading}\n',
+        additional_content=additional_content,
+        additional_text=additional_text,
+        additional_word_count=len(additional_text.split())
+    )
+
+def last_paragraph_end(html_code):
+    """Offset just past the last </p> closer in either case, or 0 if there is none"""
+    last_close = max(html_code.rfind('</p>'), html_code.rfind('</P>'))
+    return last_close + len('</p>') if last_close >= 0 else 0
+
+def has_keyword_heading(html_code, keyword_re):
+    """Check whether any H2 heading matches the focus keyword pattern"""
+    pos = 0
+    while True:
+        open_match = _H2_OPEN_RE.search(html_code, pos)
+        if not open_match:
+            return False
+        close_match = _H2_CLOSE_RE.search(html_code, open_match.end())
+        if not close_match:
+            return False
+        if keyword_re.search(html_code, open_match.end(), close_match.start()):
+            return True
+        pos = close_match.end()
+
+def optimize_html_content(html_code, focus_keyword, optimized_title):
+    """Optimize HTML content according to SEO rules, returning (html, text, word_count)"""
+    try:
+        optimized = html_code
+        
+        fragments = keyword_fragments(focus_keyword)
+        
+        # The keyword search stops at the first hit without copying the
+        # document; the H2 scan only runs when the keyword occurs at all
+        has_keyword = fragments.keyword_re.search(optimized) is not None
+        has_keyword_h2 = has_keyword and has_keyword_heading(optimized, fragments.keyword_re)
+        
+        # Add focus keyword to first paragraph if not present
+        if not has_keyword:
+            p_match = _P_RE.search(optimized, 0, last_paragraph_end(optimized))
+            if p_match:
+                p_content = p_match.group(1)
+                new_p_content = fragments.paragraph_prefix + p_content
+                optimized = optimized.replace(p_match.group(0), f'<p>{new_p_content}</p>')
+        
+        # Everything anchored on the first paragraph goes in with one splice:
+        # links at the end of it, then the TOC and the H2 right after it
+        p_close = optimized.find('</p>')
+        if p_close >= 0:
+            insert_pos = p_close + len('</p>')
+            after_first_p = fragments.after_first_p if has_keyword_h2 else fragments.after_first_p_with_h2
+            optimized = ''.join((optimized[:p_close], fragments.links, after_first_p, optimized[insert_pos:]))
+        
+        # Add H3 heading for better hierarchy
+        optimized = optimized.replace('</h2>', fragments.h2_close_with_h3, 1)
+        
+        # Add transition words to the 2nd and 3rd paragraphs, right after a
+        # plain <p> opening tag. Splicing at the match positions touches only
+        # those paragraphs, not an earlier copy of the same text or a <p>
+        # nested inside them, and rebuilds the document in one join
+        paragraphs = islice(_P_RE.finditer(optimized, 0, last_paragraph_end(optimized)), 1, 3)
+        parts = []
+        pos = 0
+        for word, match in zip(_TRANSITION_WORDS, paragraphs):
+            content_start = match.start() + len('<p>')
+            if optimized.startswith('<p>', match.start()):
+                parts.append(optimized[pos:content_start])
+                parts.append(f'{word}, ')
+                pos = content_start
+        if parts:
+            parts.append(optimized[pos:])
+            optimized = ''.join(parts)
+        
+        # Ensure content is 600+ words; the stripped text is handed back so
+        # the caller does not strip the whole document a second time
+        content_text = _TAG_STRIP_RE.sub('', optimized)
+        word_count = len(content_text.split())
+        if word_count < 600:
+            optimized += fragments.additional_content
+            content_text += fragments.additional_text
+            word_count += fragments.additional_word_count
         
-        return optimized
+        return optimized, content_text, word_count
     except Exception as e:
         # Fallback to simple optimization
-        return f"<h1>{focus_keyword}</h1><p>{focus_keyword} konusunda detaylı bilgi ve rehber.</p>{html_code}"
+        optimized = f"<h1>{focus_keyword}</h1><p>{focus_keyword} konusunda detaylı bilgi ve rehber.</p>{html_code}"
+        content_text = _TAG_STRIP_RE.sub('', optimized)
+        return optimized, content_text, len(content_text.split())
 
-def calculate_seo_score(html_code, focus_keyword, current_score):
+def scan_tags(html_code):
+    """Count the SEO-relevant start tags in a single pass over the HTML"""
+    counts = {
+        'title': 0,
+        'meta_description': 0,
+        'h1': 0,
+        'h2': 0,
+        'h3': 0,
+        'links': 0,
+        'external_links': 0,
+        'img_alt': 0
+    }
+    
+    for match in _SEO_TAG_RE.finditer(html_code):
+        tag = match.group(1).lower()
+        attrs = match.group(2)
+        
+        if tag in ('title', 'h1', 'h2', 'h3'):
+            counts[tag] += 1
+        elif tag == 'meta':
+            if _META_DESC_ATTR_RE.search(attrs):
+                counts['meta_description'] += 1
+        elif tag == 'a':
+            if _HREF_ATTR_RE.search(attrs):
+                counts['links'] += 1
+                if _HREF_EXTERNAL_ATTR_RE.search(attrs):
+                    counts['external_links'] += 1
+        elif tag == 'img':
+            if _ALT_ATTR_RE.search(attrs):
+                counts['img_alt'] += 1
+    
+    return counts
+
+def calculate_seo_score(html_code, focus_keyword, current_score, word_count=None):
     """Calculate improved SEO score based on Rank Math criteria"""
     try:
         score = current_score
         
+        # Tokenize the document once instead of one regex scan per tag type
+        tag_counts = scan_tags(html_code)
+        
+        # Lower-case once; literal checks below are plain substring scans
+        html_lower = html_code.lower()
+        
         # Title tag optimization (+10 points)
-        if re.search(r'<title>', html_code, re.IGNORECASE):
+        if tag_counts['title']:
             score += 10
         
         # Meta description (+10 points)
-        if re.search(r'<meta[^>]*name=["\']description["\'][^>]*>', html_code, re.IGNORECASE):
+        if tag_counts['meta_description']:
             score += 10
         
         # H1 tag (+5 points)
-        if re.search(r'<h1[^>]*>', html_code, re.IGNORECASE):
+        if tag_counts['h1']:
             score += 5
         
         # H2 tags (+15 points)
-        h2_count = len(re.findall(r'<h2[^>]*>', html_code, re.IGNORECASE))
+        h2_count = tag_counts['h2']
         score += min(h2_count * 5, 15)
         
         # H3 tags (+10 points)
-        h3_count = len(re.findall(r'<h3[^>]*>', html_code, re.IGNORECASE))
+        h3_count = tag_counts['h3']
         score += min(h3_count * 2, 10)
         
-        # Focus keyword in content (+15 points)
-        keyword_count = len(re.findall(re.escape(focus_keyword), html_code, re.IGNORECASE))
+        # Focus keyword in content (+15 points); matched like the optimizer's
+        # presence check, and three hits decide it, so stop searching there
+        keyword_hits = keyword_pattern(focus_keyword).finditer(html_code)
+        keyword_count = sum(1 for _ in islice(keyword_hits, 3))
         if keyword_count >= 3:
             score += 15
         
         # Internal links (+10 points)
-        internal_links = len(re.findall(r'<a[^>]*href=["\'][^"\']*["\'][^>]*>', html_code))
+        internal_links = tag_counts['links']
         score += min(internal_links * 2, 10)
         
         # External links (+5 points)
-        external_links = len(re.findall(r'<a[^>]*href=["\']https?://[^"\']*["\'][^>]*>', html_code))
+        external_links = tag_counts['external_links']
         score += min(external_links * 2, 5)
         
         # Images with alt text (+10 points)
-        img_alt_count = len(re.findall(r'<img[^>]*alt=["\'][^"\']*["\'][^>]*>', html_code))
+        img_alt_count = tag_counts['img_alt']
         score += min(img_alt_count * 2, 10)
         
         # Content length (+10 points)
-        word_count = len(re.sub(r'<[^>]+>', '', html_code).split())
+        if word_count is None:
+            word_count = len(_TAG_STRIP_RE.sub('', html_code).split())
         if word_count >= 600:
             score += 10
         
         # Table of Contents (+5 points)
-        if re.search(r'table-of-contents', html_code, re.IGNORECASE):
+        if 'table-of-contents' in html_lower:
             score += 5
         
         # Schema markup (+5 points)
-        if re.search(r'schema\.org', html_code, re.IGNORECASE):
+        if 'schema.org' in html_lower:
             score += 5
         
         # Ensure score doesn't exceed 100
@@ -250,192 +454,424 @@ def calculate_seo_score(html_code, focus_keyword, current_score):
     except Exception as e:
         return min(current_score + 25, 95)
 
-@app.route('/')
-def home():
-    """API home endpoint"""
-    return jsonify({
-        "message": "Blog SEO Optimizer API",
-        "version": "3.0.0",
-        "status": "running",
-        "features": [
-            "Title optimization (max 60 chars)",
-            "Meta description (150-160 chars)",
-            "Keyword density (0.5-2.5%)",
-            "600+ word content",
-            "H1 > H2 > H3 hierarchy",
-            "Table of Contents",
-            "Internal/External links",
-            "Image alt text",
-            "Schema markup",
-            "Rank Math 90+ score guarantee"
-        ]
-    })
+def calculate_keyword_density(text, focus_keyword, word_count):
+    """Share of the text's words taken up by the focus keyword, in percent"""
+    if not word_count or not focus_keyword.strip():
+        return 0.0
+    
+    hits = sum(1 for _ in keyword_pattern(focus_keyword).finditer(text))
+    keyword_words = len(focus_keyword.split())
+    return round(hits * keyword_words / word_count * 100, 2)
 
-@app.route('/api/optimize', methods=['POST'])
-def optimize_content():
-    """Advanced SEO optimization endpoint"""
-    try:
-        data = request.get_json()
-        
-        # Validate required fields
-        required_fields = ['title', 'html_code', 'focus_keyword', 'seo_score']
-        for field in required_fields:
-            if field not in data:
-                return jsonify({
-                    "error": f"Missing required field: {field}",
-                    "success": False
-                }), 400
-        
-        title = data['title']
-        html_code = data['html_code']
-        focus_keyword = data['focus_keyword']
-        current_score = data['seo_score']
-        
-        # Optimize components
-        optimized_title = optimize_title(title, focus_keyword)
-        optimized_meta = generate_meta_description(html_code, focus_keyword)
-        optimized_content = optimize_html_content(html_code, focus_keyword, optimized_title)
-        suggested_tags = generate_tags(focus_keyword)
-        image_fields = generate_image_fields(focus_keyword)
-        
-        # Create optimized HTML with all SEO elements
-        optimized_html = f"""<!DOCTYPE html>
+# Constant page skeleton for the optimized document, split around the
+# per-request values so rendering is a single join
+_HEAD_BEFORE_TITLE = '''<!DOCTYPE html>
 <html lang="tr">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{optimized_title}</title>
-    <meta name="description" content="{optimized_meta}">
-    <meta name="keywords" content="{', '.join(suggested_tags)}">
-    <link rel="canonical" href="https://example.com/{focus_keyword.lower().replace(' ', '-')}">
+    <title>'''
+_HEAD_BEFORE_DESCRIPTION = '''</title>
+    <meta name="description" content="'''
+_HEAD_BEFORE_KEYWORDS = '''">
+    <meta name="keywords" content="'''
+_HEAD_BEFORE_SLUG = '''">
+    <link rel="canonical" href="https://example.com/'''
+_HEAD_BEFORE_SCHEMA = '''">
     
     <!-- Schema.org structured data -->
     <script type="application/ld+json">
-    {{
+    '''
+_HEAD_END = '''
+    </script>
+</head>
+<body>
+    '''
+_DOCUMENT_TAIL = '''
+</body>
+</html>'''
+
+def render_document_head(title, description, keywords, slug, schema):
+    """Render the document head, escaping the values placed in attributes and text"""
+    return ''.join((
+        _HEAD_BEFORE_TITLE, html.escape(title),
+        _HEAD_BEFORE_DESCRIPTION, html.escape(description),
+        _HEAD_BEFORE_KEYWORDS, html.escape(keywords),
+        _HEAD_BEFORE_SLUG, html.escape(slug),
+        _HEAD_BEFORE_SCHEMA, schema,
+        _HEAD_END
+    ))
+
+def build_article_schema(headline, description, focus_keyword, word_count):
+    """Build the Article JSON-LD block embedded in the document head"""
+    schema = orjson.dumps({
         "@context": "https://schema.org",
         "@type": "Article",
-        "headline": "{optimized_title}",
-        "description": "{optimized_meta}",
-        "keywords": "{focus_keyword}",
-        "author": {{
+        "headline": headline,
+        "description": description,
+        "keywords": focus_keyword,
+        "author": {
             "@type": "Organization",
             "name": "Blog SEO Optimizer"
-        }},
-        "publisher": {{
+        },
+        "publisher": {
             "@type": "Organization",
             "name": "Blog SEO Optimizer"
-        }},
+        },
         "datePublished": "2025-01-01",
         "dateModified": "2025-01-01",
-        "wordCount": "{len(optimized_content.split())}",
+        "wordCount": word_count,
         "articleSection": "Blog"
-    }}
-    </script>
-</head>
-<body>
-    {optimized_content}
-</body>
-</html>"""
+    }, option=orjson.OPT_INDENT_2).decode('utf-8')
+    
+    # Keep '</script>' inside string values from closing the block early
+    return schema.replace('</', '<\\/').replace('\n', '\n    ')
+
+def optimize_document(title, html_code, focus_keyword, current_score):
+    """Run the full optimization pipeline and return the response data"""
+    # Optimize components
+    optimized_title = optimize_title(title, focus_keyword)
+    optimized_meta = generate_meta_description(html_code, focus_keyword)
+    optimized_content, content_text, word_count = optimize_html_content(html_code, focus_keyword, optimized_title)
+    suggested_tags = generate_tags(focus_keyword)
+    image_fields = generate_image_fields(focus_keyword)
+    
+    # Create optimized HTML with all SEO elements
+    schema = build_article_schema(optimized_title, optimized_meta, focus_keyword, word_count)
+    head = render_document_head(
+        optimized_title,
+        optimized_meta,
+        ', '.join(suggested_tags),
+        keyword_slug(focus_keyword),
+        schema
+    )
+    optimized_html = ''.join((head, optimized_content, _DOCUMENT_TAIL))
+    # The content was counted while optimizing; only the short head is stripped here
+    document_word_count = len(_TAG_STRIP_RE.sub('', head).split()) + word_count
+    
+    # Calculate new SEO score
+    new_score = calculate_seo_score(optimized_html, focus_keyword, current_score, document_word_count)
+    improvement = new_score - current_score
+    
+    return {
+        "optimized_title": optimized_title,
+        "optimized_html": optimized_html,
+        "suggested_tags": ', '.join(suggested_tags),
+        "alt_text": image_fields['alt_text'],
+        "image_title": image_fields['image_title'],
+        "image_caption": image_fields['image_caption'],
+        "image_description": image_fields['image_description'],
+        "seo_score_before": current_score,
+        "seo_score_after": new_score,
+        "improvement": improvement,
+        "word_count": word_count,
+        "keyword_density": calculate_keyword_density(content_text, focus_keyword, word_count),
+        "title_length": len(optimized_title),
+        "meta_length": len(optimized_meta),
+        "optimizations": [
+            "Title optimized with focus keyword at beginning",
+            "Meta description generated (150-160 chars)",
+            "H1 > H2 > H3 hierarchy implemented",
+            "Table of Contents added",
+            "Internal links (2+) and external links (1+) added",
+            "600+ word content ensured",
+            "Transition words added for readability",
+            "Schema markup included",
+            "Image alt text optimized",
+            "Rank Math 90+ score achieved"
+        ]
+    }
+
+def _response_cache_key(title, html_code, focus_keyword, current_score):
+    """BLAKE2 digest identifying an optimization request"""
+    header = repr((title, focus_keyword, current_score, type(html_code).__name__))
+    digest = hashlib.blake2b(header.encode('utf-8', 'surrogatepass'), digest_size=16)
+    digest.update(b'\0')
+    digest.update(str(html_code).encode('utf-8', 'surrogatepass'))
+    return digest.digest()
+
+def _result_size(result):
+    """Approximate memory held by an optimize_document() result, in bytes"""
+    return sum(sys.getsizeof(value) for value in result.values() if isinstance(value, str))
+
+def get_optimization(title, html_code, focus_keyword, current_score):
+    """Return optimize_document() output, reusing results for repeated requests"""
+    global _response_cache_bytes
+    
+    key = _response_cache_key(title, html_code, focus_keyword, current_score)
+    with _response_cache_lock:
+        cached = _response_cache.get(key)
+        if cached is not None:
+            _response_cache.move_to_end(key)
+            return cached[0]
+    
+    result = optimize_document(title, html_code, focus_keyword, current_score)
+    size = _result_size(result)
+    if size > _RESPONSE_CACHE_MAX_ENTRY_BYTES:
+        return result
+    
+    with _response_cache_lock:
+        previous = _response_cache.pop(key, None)
+        if previous is not None:
+            _response_cache_bytes -= previous[1]
+        _response_cache[key] = (result, size)
+        _response_cache_bytes += size
+        while (len(_response_cache) > _RESPONSE_CACHE_SIZE
+               or _response_cache_bytes > _RESPONSE_CACHE_MAX_BYTES):
+            _response_cache_bytes -= _response_cache.popitem(last=False)[1][1]
+    
+    return result
+
+def accepts_gzip():
+    """Check whether the current request accepts a gzip-encoded response"""
+    return request.accept_encodings['gzip'] > 0
+
+def json_response(payload, status=200):
+    """Serialize a payload with orjson into a JSON response, gzipped when accepted"""
+    body = orjson.dumps(payload)
+    if len(body) < _GZIP_MIN_SIZE:
+        return app.response_class(body, status=status, mimetype='application/json')
+    
+    # The optimized HTML inside the JSON compresses several times over
+    headers = [('Vary', 'Accept-Encoding')]
+    if accepts_gzip():
+        body = gzip.compress(body, compresslevel=_GZIP_LEVEL, mtime=0)
+        headers.append(('Content-Encoding', 'gzip'))
+    return app.response_class(body, status=status, mimetype='application/json', headers=headers)
+
+def parse_json_body():
+    """Parse the raw request body with orjson, returning (data, error_response)"""
+    try:
+        return orjson.loads(request.get_data(cache=False)), None
+    except orjson.JSONDecodeError:
+        return None, json_response({
+            "error": "Invalid JSON body",
+            "success": False
+        }, 400)
+    except RequestEntityTooLarge:
+        return None, json_response({
+            "error": "Request body too large",
+            "success": False
+        }, 413)
+
+def serialize_static_json(payload, max_age=3600):
+    """Serialize a constant JSON payload once at import, returning (plain, gzipped)"""
+    body = orjson.dumps(payload)
+    etag = hashlib.blake2b(body, digest_size=16).hexdigest()
+    cache_control = f'public, max-age={max_age}' if max_age else 'no-cache'
+    headers = (('ETag', f'"{etag}"'), ('Cache-Control', cache_control))
+    if len(body) < _GZIP_MIN_SIZE:
+        return (body, headers), None
+    
+    # Compressed up front so serving it costs nothing per request; the two
+    # encodings are different bytes, so they get different ETags
+    vary = ('Vary', 'Accept-Encoding')
+    gzip_headers = (
+        ('ETag', f'"{etag}-gzip"'),
+        ('Cache-Control', cache_control),
+        ('Content-Encoding', 'gzip'),
+        vary
+    )
+    gzip_body = gzip.compress(body, compresslevel=9, mtime=0)
+    return (body, headers + (vary,)), (gzip_body, gzip_headers)
+
+def static_json_response(variants):
+    """Serve a precomputed JSON body, answering 304 when the client's ETag matches"""
+    plain, gzipped = variants
+    body, headers = gzipped if gzipped and accepts_gzip() else plain
+    # A fresh response per request: CORS and make_conditional mutate it
+    response = app.response_class(body, mimetype='application/json', headers=headers)
+    return response.make_conditional(request)
+
+_HOME_RESPONSE = serialize_static_json({
+    "message": SERVICE_NAME,
+    "version": API_VERSION,
+    "status": "running",
+    "features": [
+        "Title optimization (max 60 chars)",
+        "Meta description (150-160 chars)",
+        "Keyword density (0.5-2.5%)",
+        "600+ word content",
+        "H1 > H2 > H3 hierarchy",
+        "Table of Contents",
+        "Internal/External links",
+        "Image alt text",
+        "Schema markup",
+        "Rank Math 90+ score guarantee"
+    ]
+})
+
+@app.route('/')
+def home():
+    """API home endpoint"""
+    return static_json_response(_HOME_RESPONSE)
+
+def optimize_item(data):
+    """Validate and optimize one request payload, returning (body, status)"""
+    try:
+        # Batch items arrive unchecked; anything but an object is a client error
+        if not isinstance(data, dict):
+            return {
+                "error": "Request body must be a JSON object",
+                "success": False
+            }, 400
+        
+        # Validate required fields with one set difference
+        missing = _REQUIRED_FIELD_SET.difference(data)
+        if missing:
+            field = next(name for name in _REQUIRED_FIELDS if name in missing)
+            return {
+                "error": f"Missing required field: {field}",
+                "success": False
+            }, 400
+        
+        title = data['title']
+        html_code = data['html_code']
+        focus_keyword = data['focus_keyword']
+        current_score = data['seo_score']
+        
+        if isinstance(focus_keyword, str) and len(focus_keyword) > MAX_KEYWORD_LENGTH:
+            return {
+                "error": f"focus_keyword too long: at most {MAX_KEYWORD_LENGTH} characters",
+                "success": False
+            }, 400
+        
+        return {
+            "success": True,
+            "data": get_optimization(title, html_code, focus_keyword, current_score)
+        }, 200
         
-        # Calculate new SEO score
-        new_score = calculate_seo_score(optimized_html, focus_keyword, current_score)
-        improvement = new_score - current_score
+    except Exception as e:
+        return {
+            "error": str(e),
+            "success": False
+        }, 500
+
+@app.route('/api/optimize', methods=['POST'])
+def optimize_content():
+    """Advanced SEO optimization endpoint"""
+    try:
+        data, error = parse_json_body()
+        if error:
+            return error
+        
+        body, status = optimize_item(data)
+        return json_response(body, status)
         
-        return jsonify({
+    except Exception as e:
+        return json_response({
+            "error": str(e),
+            "success": False
+        }, 500)
+
+@app.route('/api/optimize/batch', methods=['POST'])
+def optimize_batch():
+    """Optimize several documents in one request"""
+    try:
+        data, error = parse_json_body()
+        if error:
+            return error
+        
+        if not isinstance(data, dict) or 'items' not in data:
+            return json_response({
+                "error": "Missing required field: items",
+                "success": False
+            }, 400)
+        
+        items = data['items']
+        if not isinstance(items, list):
+            return json_response({
+                "error": "items must be an array",
+                "success": False
+            }, 400)
+        
+        if len(items) > MAX_BATCH_ITEMS:
+            return json_response({
+                "error": f"Too many items: at most {MAX_BATCH_ITEMS} per batch",
+                "success": False
+            }, 400)
+        
+        # Items share the compiled patterns and caches; a failing item
+        # reports its own error without aborting the rest of the batch.
+        # The work is pure-Python and regex code that holds the GIL, so a
+        # thread pool here would only add handoff cost; gunicorn workers
+        # are what spread load across cores.
+        results = [optimize_item(item)[0] for item in items]
+        
+        return json_response({
             "success": True,
-            "data": {
-                "optimized_title": optimized_title,
-                "optimized_html": optimized_html,
-                "suggested_tags": ', '.join(suggested_tags),
-                "alt_text": image_fields['alt_text'],
-                "image_title": image_fields['image_title'],
-                "image_caption": image_fields['image_caption'],
-                "image_description": image_fields['image_description'],
-                "seo_score_before": current_score,
-                "seo_score_after": new_score,
-                "improvement": improvement,
-                "word_count": len(re.sub(r'<[^>]+>', '', optimized_content).split()),
-                "keyword_density": round(random.uniform(1.2, 2.1), 1),
-                "title_length": len(optimized_title),
-                "meta_length": len(optimized_meta),
-                "optimizations": [
-                    "Title optimized with focus keyword at beginning",
-                    "Meta description generated (150-160 chars)",
-                    "H1 > H2 > H3 hierarchy implemented",
-                    "Table of Contents added",
-                    "Internal links (2+) and external links (1+) added",
-                    "600+ word content ensured",
-                    "Transition words added for readability",
-                    "Schema markup included",
-                    "Image alt text optimized",
-                    "Rank Math 90+ score achieved"
-                ]
-            }
+            "results": results
         })
         
     except Exception as e:
-        return jsonify({
+        return json_response({
             "error": str(e),
             "success": False
-        }), 500
+        }, 500)
+
+# Always revalidate so monitors reach the live process
+_HEALTH_RESPONSE = serialize_static_json({
+    "status": "healthy",
+    "service": SERVICE_NAME,
+    "version": API_VERSION,
+    "rank_math_guarantee": "90+ score"
+}, max_age=0)
 
 @app.route('/api/health', methods=['GET'])
 def health_check():
     """Health check endpoint"""
-    return jsonify({
-        "status": "healthy",
-        "service": "Blog SEO Optimizer API",
-        "version": "3.0.0",
-        "rank_math_guarantee": "90+ score"
-    })
+    return static_json_response(_HEALTH_RESPONSE)
+
+_FEATURES_RESPONSE = serialize_static_json({
+    "features": [
+        {
+            "name": "Title Optimization",
+            "description": "Focus keyword at beginning, max 60 characters",
+            "icon": "⚡"
+        },
+        {
+            "name": "Meta Description",
+            "description": "SEO-friendly descriptions (150-160 characters)",
+            "icon": "📝"
+        },
+        {
+            "name": "Content Optimization",
+            "description": "600+ words, proper heading hierarchy",
+            "icon": "📋"
+        },
+        {
+            "name": "Table of Contents",
+            "description": "Automatic TOC generation",
+            "icon": "📑"
+        },
+        {
+            "name": "Link Optimization",
+            "description": "Internal (2+) and external (1+) links",
+            "icon": "🔗"
+        },
+        {
+            "name": "Image Optimization",
+            "description": "Automatic alt text and title generation",
+            "icon": "🖼️"
+        },
+        {
+            "name": "Schema Markup",
+            "description": "Structured data for better search results",
+            "icon": "🏷️"
+        },
+        {
+            "name": "Rank Math 90+",
+            "description": "Guaranteed 90+ SEO score",
+            "icon": "🎯"
+        }
+    ]
+})
 
 @app.route('/api/features', methods=['GET'])
 def get_features():
     """Get available features"""
-    return jsonify({
-        "features": [
-            {
-                "name": "Title Optimization",
-                "description": "Focus keyword at beginning, max 60 characters",
-                "icon": "⚡"
-            },
-            {
-                "name": "Meta Description",
-                "description": "SEO-friendly descriptions (150-160 characters)",
-                "icon": "📝"
-            },
-            {
-                "name": "Content Optimization",
-                "description": "600+ words, proper heading hierarchy",
-                "icon": "📋"
-            },
-            {
-                "name": "Table of Contents",
-                "description": "Automatic TOC generation",
-                "icon": "📑"
-            },
-            {
-                "name": "Link Optimization",
-                "description": "Internal (2+) and external (1+) links",
-                "icon": "🔗"
-            },
-            {
-                "name": "Image Optimization",
-                "description": "Automatic alt text and title generation",
-                "icon": "🖼️"
-            },
-            {
-                "name": "Schema Markup",
-                "description": "Structured data for better search results",
-                "icon": "🏷️"
-            },
-            {
-                "name": "Rank Math 90+",
-                "description": "Guaranteed 90+ SEO score",
-                "icon": "🎯"
-            }
-        ]
-    })
+    return static_json_response(_FEATURES_RESPONSE)
 
 if __name__ == '__main__':
-    app.run(debug=True, host='0.0.0.0', port=8080)
+    # Development server only; production runs under gunicorn (gunicorn.conf.py)
+    app.run(debug=os.environ.get('FLASK_DEBUG') == '1', host='0.0.0.0', port=8080)
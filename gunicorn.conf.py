@@ -0,0 +1,14 @@
+# Gunicorn settings for self-hosted deployments: gunicorn app:app
+import multiprocessing
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', '8080')}"
+workers = int(os.environ.get('WEB_CONCURRENCY', multiprocessing.cpu_count()))
+worker_class = 'gthread'
+# The work is CPU-bound and holds the GIL inside re, so a second thread only
+# overlaps socket I/O; more threads per worker just contend for the lock
+threads = int(os.environ.get('GUNICORN_THREADS', 2))
+
+# Import the app before forking so workers share the compiled patterns
+# and precomputed payloads copy-on-write
+preload_app = True
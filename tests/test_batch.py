@@ -0,0 +1,76 @@
+"""Contract tests for POST /api/optimize/batch"""
+
+import unittest
+
+from app import app, MAX_BATCH_ITEMS
+
+VALID_ITEM = {
+    "title": "Başlık",
+    "html_code": "<h1>Başlık</h1><p>İçerik.</p>",
+    "focus_keyword": "SEO optimizasyonu",
+    "seo_score": 65
+}
+
+
+class BatchEndpointTest(unittest.TestCase):
+
+    def setUp(self):
+        self.client = app.test_client()
+
+    def post(self, payload):
+        return self.client.post('/api/optimize/batch', json=payload)
+
+    def test_mixed_items_report_per_item_results(self):
+        response = self.post({"items": [VALID_ITEM, {"title": "t"}, 3]})
+        self.assertEqual(response.status_code, 200)
+        body = response.get_json()
+        self.assertTrue(body["success"])
+        good, missing, not_object = body["results"]
+        self.assertTrue(good["success"])
+        self.assertIn("optimized_html", good["data"])
+        self.assertEqual(missing, {
+            "error": "Missing required field: html_code",
+            "success": False
+        })
+        self.assertEqual(not_object, {
+            "error": "Request body must be a JSON object",
+            "success": False
+        })
+
+    def test_item_limit(self):
+        response = self.post({"items": [VALID_ITEM] * MAX_BATCH_ITEMS})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(response.get_json()["results"]), MAX_BATCH_ITEMS)
+
+        response = self.post({"items": [VALID_ITEM] * (MAX_BATCH_ITEMS + 1)})
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(response.get_json()["success"])
+
+    def test_missing_items(self):
+        for payload in ({}, [VALID_ITEM]):
+            response = self.post(payload)
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json()["error"], "Missing required field: items")
+
+    def test_items_must_be_an_array(self):
+        for items in (3, {}, "items", None):
+            response = self.post({"items": items})
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.get_json()["error"], "items must be an array")
+
+    def test_invalid_json(self):
+        response = self.client.post('/api/optimize/batch', data=b'{"items": [',
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json()["error"], "Invalid JSON body")
+
+    def test_body_too_large(self):
+        body = b'{"items": ["' + b'x' * app.config['MAX_CONTENT_LENGTH'] + b'"]}'
+        response = self.client.post('/api/optimize/batch', data=body,
+                                    content_type='application/json')
+        self.assertEqual(response.status_code, 413)
+        self.assertEqual(response.get_json()["error"], "Request body too large")
+
+
+if __name__ == '__main__':
+    unittest.main()
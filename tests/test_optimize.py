@@ -0,0 +1,62 @@
+"""Regression tests for the HTML content optimizer"""
+
+import unittest
+
+from app import (
+    app, calculate_keyword_density, calculate_seo_score, optimize_html_content,
+    MAX_KEYWORD_LENGTH
+)
+
+UPPERCASE_PARAGRAPHS = '<P>Merhaba dünya.</P>\n<P>İkinci paragraf.</P>\n<P>Üçüncü paragraf.</P>'
+
+
+class OptimizeHtmlContentTest(unittest.TestCase):
+
+    def test_keyword_added_to_uppercase_first_paragraph(self):
+        optimized, _, _ = optimize_html_content(UPPERCASE_PARAGRAPHS, 'kedi', 'Başlık')
+        self.assertTrue(optimized.startswith('<p>kedi konusunda Merhaba dünya.'))
+
+    def test_transition_words_reach_uppercase_paragraphs(self):
+        # Only the first paragraph is lower-case; the others close with </P>
+        html_code = '<p>Merhaba kedi.</p>\n<p>İkinci paragraf.</P>\n<p>Üçüncü paragraf.</P>'
+        optimized, _, _ = optimize_html_content(html_code, 'kedi', 'Başlık')
+        self.assertIn('<p>Ayrıca, İkinci paragraf.</P>', optimized)
+        self.assertIn('<p>Bununla birlikte, Üçüncü paragraf.</P>', optimized)
+
+
+class KeywordMatchingTest(unittest.TestCase):
+    """The presence check, the score and the density must agree on what a hit is"""
+
+    def test_turkish_dotted_capital_counts_everywhere(self):
+        text = 'istanbul gezisi. istanbul müzeleri. istanbul sokakları.'
+        html_code = f'<p>{text}</p>'
+
+        optimized, _, _ = optimize_html_content(html_code, 'İstanbul', 'Başlık')
+        self.assertFalse(optimized.startswith('<p>İstanbul konusunda'))
+
+        with_hits = calculate_seo_score(html_code, 'İstanbul', 0)
+        without_hits = calculate_seo_score('<p>x</p>', 'İstanbul', 0)
+        self.assertEqual(with_hits - without_hits, 15)
+
+        self.assertEqual(calculate_keyword_density(text, 'İstanbul', 6), 50.0)
+
+
+class OptimizeEndpointTest(unittest.TestCase):
+
+    def test_focus_keyword_length_limit(self):
+        client = app.test_client()
+        payload = {"title": "t", "html_code": "<p>x</p>", "seo_score": 50}
+
+        response = client.post('/api/optimize', json={**payload, "focus_keyword": "k" * MAX_KEYWORD_LENGTH})
+        self.assertEqual(response.status_code, 200)
+
+        response = client.post('/api/optimize', json={**payload, "focus_keyword": "k" * (MAX_KEYWORD_LENGTH + 1)})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.get_json(), {
+            "error": f"focus_keyword too long: at most {MAX_KEYWORD_LENGTH} characters",
+            "success": False
+        })
+
+
+if __name__ == '__main__':
+    unittest.main()